@@ -91,7 +91,7 @@ package_lambda() {
     cd "$SCRIPT_DIR/lambda"
 
     rm -f lambda.zip
-    zip -q lambda.zip handler.py requirements.txt || error "Failed to package Lambda"
+    zip -q lambda.zip handler.py provisioner.py relay.py requirements.txt || error "Failed to package Lambda"
 
     log "✓ Lambda packaged: $(du -h lambda.zip | cut -f1)"
 }
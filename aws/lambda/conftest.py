@@ -0,0 +1,9 @@
+"""
+ABOUTME: Pytest configuration for the Lambda function tests
+ABOUTME: Puts the Lambda sources on sys.path once so tests import them as top-level modules
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
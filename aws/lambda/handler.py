@@ -9,94 +9,181 @@ import time
 import boto3
 import os
 import base64
+import hmac
 import re
-from datetime import datetime
-from urllib.parse import urlparse, urlunparse
-from botocore.exceptions import ClientError
-
-# AWS clients
-dynamodb = boto3.client('dynamodb')
-ec2 = boto3.client('ec2')
-ssm = boto3.client('ssm')
-kms = boto3.client('kms')
-sqs = boto3.client('sqs')
-cloudwatch = boto3.client('cloudwatch')
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from urllib.parse import quote, urlparse, urlunparse
+from botocore.config import Config
+
+# AWS clients (created on first use; most requests only need one or two)
+_clients = {}
+_clients_lock = threading.Lock()
+
+# Per-service client configuration; EC2 launches use botocore's adaptive retries
+_CLIENT_CONFIGS = {
+    'ec2': Config(retries={'mode': 'adaptive', 'max_attempts': 4}),
+}
 
 # Configuration from environment variables
 DYNAMODB_TABLE = os.environ.get('DYNAMODB_TABLE', 'replication-jobs')
+DYNAMODB_STATUS_INDEX = os.environ.get('DYNAMODB_STATUS_INDEX', 'status-created-index')
 WORKER_AMI_ID = os.environ.get('WORKER_AMI_ID', 'ami-xxxxxxxxx')
 WORKER_INSTANCE_TYPE = os.environ.get('WORKER_INSTANCE_TYPE', 'c5.2xlarge')
 WORKER_IAM_ROLE = os.environ.get('WORKER_IAM_ROLE', 'seren-replication-worker')
 KMS_KEY_ID = os.environ.get('KMS_KEY_ID')
 API_KEY_PARAMETER_NAME = os.environ.get('API_KEY_PARAMETER_NAME')
 MAX_CONCURRENT_JOBS = int(os.environ.get('MAX_CONCURRENT_JOBS', '10'))
-PROVISIONING_QUEUE_URL = os.environ.get('PROVISIONING_QUEUE_URL')
 AWS_REGION = os.environ.get('AWS_REGION', 'us-east-1')
+API_KEY_TTL_SECONDS = int(os.environ.get('API_KEY_TTL_SECONDS', '300'))
+
+# Shared compact JSON encoder (skips per-call encoder setup and padding whitespace)
+_json_dumps = json.JSONEncoder(separators=(',', ':')).encode
 
-# Cache for API key (loaded once per Lambda container lifecycle)
+# Constant error responses for the auth/routing short-circuit paths (never mutated)
+_RESP_UNAUTHORIZED = {'statusCode': 401, 'body': _json_dumps({'error': 'Unauthorized'})}
+_RESP_NOT_FOUND = {'statusCode': 404, 'body': _json_dumps({'error': 'Not found'})}
+_RESP_INTERNAL_ERROR = {'statusCode': 500, 'body': _json_dumps({'error': 'Internal server error'})}
+
+# Thread pool for overlapping KMS calls (reused across invocations)
+_KMS_POOL = ThreadPoolExecutor(max_workers=2)
+
+# Cache for API key as (value, fetched_at monotonic seconds), refreshed after API_KEY_TTL_SECONDS
 _api_key_cache = None
 
 # Schema version for job specs
 CURRENT_SCHEMA_VERSION = "1.0"
-SUPPORTED_SCHEMA_VERSIONS = ["1.0"]
+SUPPORTED_SCHEMA_VERSIONS = frozenset({"1.0"})
 
 # Validation constants
 MAX_JOB_SPEC_SIZE_BYTES = 15 * 1024  # 15KB (leave 1KB buffer for EC2 user-data limit of 16KB)
 MAX_URL_LENGTH = 2048
+MAX_HOSTNAME_LENGTH = 253  # DNS limit for a full hostname
 MAX_COMMAND_LENGTH = 50
-ALLOWED_COMMANDS = ["init", "validate", "sync", "status", "verify"]
-
-
-def validate_job_spec(body):
+ALLOWED_COMMANDS = frozenset({"init", "validate", "sync", "status", "verify"})
+
+# Static parts of the job spec schema, resolved once at import
+_REQUIRED_FIELDS = ('command', 'source_url', 'target_url')
+_REQUIRED_FIELD_SET = frozenset(_REQUIRED_FIELDS)
+_SUPPORTED_VERSIONS_TEXT = ', '.join(sorted(SUPPORTED_SCHEMA_VERSIONS))
+_ALLOWED_COMMANDS_TEXT = ', '.join(sorted(ALLOWED_COMMANDS))
+
+# Allowed job options: name -> (exact accepted types, description for error messages).
+# Exact type matching keeps booleans from passing as numbers (bool subclasses int)
+_OPTION_TYPES = {
+    'drop_existing': ((bool,), 'a boolean'),
+    'enable_sync': ((bool,), 'a boolean'),
+    'estimated_size_bytes': ((int, float), 'a number'),
+}
+
+# URL validation patterns (compiled once per Lambda container)
+_PG_URL_PREFIXES = ('postgresql://', 'postgres://')
+_DANGEROUS_RE = re.compile(
+    r';\s*\w+'  # Command chaining with semicolon
+    r'|\$\('    # Command substitution
+    r'|`'       # Backtick command substitution
+    r'|\|\|'    # OR operator (potential SQL injection)
+    r'|&&'      # AND operator (potential command injection)
+)
+# Dot-separated labels of 1-63 alphanumerics/hyphens, not starting or ending with a hyphen
+_HOSTNAME_RE = re.compile(
+    r'^[a-zA-Z0-9](?:[a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?'
+    r'(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?)*$'
+)
+# Alphanumerics, underscores and hyphens, not starting with a hyphen (could read as a CLI flag)
+_DBNAME_RE = re.compile(r'^[a-zA-Z0-9_][a-zA-Z0-9_\-]*$')
+
+# DynamoDB expression constants shared across calls (treat as read-only)
+_STATUS_NAMES = {'#status': 'status'}
+_STATUS_KEY_CONDITION = '#status = :status'
+_ACTIVE_STATUS_VALUES = (
+    {':status': {'S': 'provisioning'}},
+    {':status': {'S': 'running'}},
+)
+
+# Instance type tiers as (exclusive upper size bound in bytes, instance type)
+_INSTANCE_TYPE_TIERS = (
+    (10 * 1024**3, 't3.medium'),
+    (100 * 1024**3, 'c5.large'),
+    (1024 * 1024**3, 'c5.2xlarge'),
+)
+
+
+def _client(service_name):
+    """Return the cached boto3 client for a service, creating it on first use"""
+    client = _clients.get(service_name)
+    if client is None:
+        # Client creation on the shared default session is not thread-safe
+        with _clients_lock:
+            client = _clients.get(service_name)
+            if client is None:
+                client = _clients[service_name] = boto3.client(
+                    service_name, config=_CLIENT_CONFIGS.get(service_name)
+                )
+    return client
+
+
+def validate_job_spec(body, raw_body=None):
     """
     Comprehensive validation of job specification
 
+    Args:
+        body: Parsed job spec
+        raw_body: Original request body string, if available. Its length is
+            used for the size check instead of re-serializing the spec.
+
     Returns:
         tuple: (is_valid, error_message)
             - is_valid: True if spec is valid, False otherwise
             - error_message: None if valid, error string if invalid
     """
 
-    # 1. Check total size
-    body_json = json.dumps(body)
-    body_size = len(body_json.encode('utf-8'))
-    if body_size > MAX_JOB_SPEC_SIZE_BYTES:
-        return False, f"Job spec too large: {body_size} bytes (max: {MAX_JOB_SPEC_SIZE_BYTES})"
-
-    # 2. Validate schema version
+    # 1. Validate schema version
     schema_version = body.get('schema_version')
     if not schema_version:
         return False, "Missing required field: schema_version"
 
-    if schema_version not in SUPPORTED_SCHEMA_VERSIONS:
-        return False, f"Unsupported schema version: {schema_version} (supported: {', '.join(SUPPORTED_SCHEMA_VERSIONS)})"
+    # Non-string versions are rejected before the (hash-based) set lookup
+    if not isinstance(schema_version, str) or schema_version not in SUPPORTED_SCHEMA_VERSIONS:
+        return False, f"Unsupported schema version: {schema_version} (supported: {_SUPPORTED_VERSIONS_TEXT})"
 
-    # 3. Validate required fields
-    required_fields = ['command', 'source_url', 'target_url']
-    for field in required_fields:
-        if field not in body:
-            return False, f"Missing required field: {field}"
+    # 2. Validate required fields
+    missing_fields = _REQUIRED_FIELD_SET - body.keys()
+    if missing_fields:
+        return False, f"Missing required field: {', '.join(sorted(missing_fields))}"
+
+    for field in _REQUIRED_FIELDS:
         if not isinstance(body[field], str):
             return False, f"Field '{field}' must be a string"
         if not body[field].strip():
             return False, f"Field '{field}' cannot be empty"
 
-    # 4. Validate command
+    # 3. Validate command
     command = body['command'].strip().lower()
     if len(command) > MAX_COMMAND_LENGTH:
         return False, f"Command too long: {len(command)} chars (max: {MAX_COMMAND_LENGTH})"
 
     if command not in ALLOWED_COMMANDS:
-        return False, f"Invalid command: {command} (allowed: {', '.join(ALLOWED_COMMANDS)})"
+        return False, f"Invalid command: {command} (allowed: {_ALLOWED_COMMANDS_TEXT})"
+
+    # 4. Check total size (after the cheap checks so malformed specs fail fast)
+    if raw_body is not None:
+        # ASCII bodies (the common case) are one byte per character
+        body_size = len(raw_body) if raw_body.isascii() else len(raw_body.encode('utf-8'))
+    else:
+        # String values alone are a lower bound on the serialized size, so
+        # specs they already push over the limit skip serialization
+        body_size = sum(len(value) for value in body.values() if isinstance(value, str))
+        if body_size <= MAX_JOB_SPEC_SIZE_BYTES:
+            # The encoder escapes non-ASCII, so its output length is the byte size
+            body_size = len(_json_dumps(body))
+    if body_size > MAX_JOB_SPEC_SIZE_BYTES:
+        return False, f"Job spec too large: {body_size} bytes (max: {MAX_JOB_SPEC_SIZE_BYTES})"
 
     # 5. Validate PostgreSQL connection URLs
     for url_field in ['source_url', 'target_url']:
-        url = body[url_field]
-
-        if len(url) > MAX_URL_LENGTH:
-            return False, f"{url_field} too long: {len(url)} chars (max: {MAX_URL_LENGTH})"
-
-        is_valid, error = validate_postgresql_url(url)
+        is_valid, error = validate_postgresql_url(body[url_field])
         if not is_valid:
             return False, f"Invalid {url_field}: {error}"
 
@@ -106,20 +193,17 @@ def validate_job_spec(body):
             return False, "Field 'options' must be an object"
 
         # Validate option types
-        allowed_option_keys = ['drop_existing', 'enable_sync', 'estimated_size_bytes']
-        for key in body['options']:
-            if key not in allowed_option_keys:
+        for key, value in body['options'].items():
+            option_type = _OPTION_TYPES.get(key)
+            if option_type is None:
                 return False, f"Unknown option: {key}"
 
-            if key in ['drop_existing', 'enable_sync']:
-                if not isinstance(body['options'][key], bool):
-                    return False, f"Option '{key}' must be a boolean"
+            expected_types, type_name = option_type
+            if type(value) not in expected_types:
+                return False, f"Option '{key}' must be {type_name}"
 
-            if key == 'estimated_size_bytes':
-                if not isinstance(body['options'][key], (int, float)):
-                    return False, f"Option '{key}' must be a number"
-                if body['options'][key] < 0:
-                    return False, f"Option '{key}' must be non-negative"
+            if key == 'estimated_size_bytes' and value < 0:
+                return False, f"Option '{key}' must be non-negative"
 
     # 7. Validate filter (if present)
     if 'filter' in body:
@@ -129,6 +213,59 @@ def validate_job_spec(body):
     return True, None
 
 
+def _split_pg_url(url):
+    """
+    Split a connection URL into its components in a single pass
+
+    Specialized for scheme://[userinfo@]host[:port][/path][?query][#fragment],
+    avoiding the general-purpose urlparse machinery on the validation path.
+    Hostname and port follow urlparse semantics: the host comes after the
+    last '@', is lowercased, and an empty port is treated as absent.
+
+    Returns:
+        tuple: (scheme, netloc, hostname, port_or_None, path), port as an int
+
+    Raises:
+        ValueError: If a bracketed host is malformed or the port is not numeric
+    """
+    scheme, separator, rest = url.partition('://')
+    if not separator:
+        return '', '', '', None, ''
+
+    # Authority ends at the first '/', '?' or '#'
+    netloc_end = len(rest)
+    for delimiter in '/?#':
+        index = rest.find(delimiter, 0, netloc_end)
+        if index != -1:
+            netloc_end = index
+    netloc = rest[:netloc_end]
+
+    # Path excludes any query string or fragment
+    path = rest[netloc_end:]
+    for delimiter in '?#':
+        index = path.find(delimiter)
+        if index != -1:
+            path = path[:index]
+
+    if '[' in netloc or ']' in netloc:
+        # IPv6 literals (or stray brackets) need urlparse's validation;
+        # raises ValueError for malformed ones
+        parsed = urlparse(url)
+        return parsed.scheme, parsed.netloc, parsed.hostname or '', parsed.port, parsed.path
+
+    hostname, _, port = netloc.rpartition('@')[2].partition(':')
+
+    # ASCII digits only: int() alone would accept '-1', '+5', ' 5' and non-ASCII digits
+    if not port:
+        port = None
+    elif port.isdigit() and port.isascii():
+        port = int(port)
+    else:
+        raise ValueError("Invalid port format")
+
+    return scheme.lower(), netloc, hostname.lower(), port, path
+
+
 def validate_postgresql_url(url):
     """
     Validate PostgreSQL connection URL format
@@ -137,99 +274,102 @@ def validate_postgresql_url(url):
         tuple: (is_valid, error_message)
     """
 
-    # Check for obvious injection attempts
-    dangerous_patterns = [
-        r';\s*\w+',  # Command chaining with semicolon
-        r'\$\(',     # Command substitution
-        r'`',        # Backtick command substitution
-        r'\|\|',     # OR operator (potential SQL injection)
-        r'&&',       # AND operator (potential command injection)
-    ]
+    # Bound the input before running any regex over it
+    if len(url) > MAX_URL_LENGTH:
+        return False, f"URL too long: {len(url)} chars (max: {MAX_URL_LENGTH})"
+
+    # Validate scheme first: a single prefix test, case-sensitive like libpq
+    if not url.startswith(_PG_URL_PREFIXES):
+        scheme, separator, _ = url.partition('://')
+        scheme = scheme if separator else ''
+        return False, f"Invalid scheme: {scheme} (must be 'postgresql' or 'postgres')"
 
-    for pattern in dangerous_patterns:
-        if re.search(pattern, url):
-            return False, "URL contains potentially dangerous characters"
+    # Check for obvious injection attempts; the plain substring tests are
+    # cheaper than the regex and let clean URLs skip it entirely
+    if ((';' in url or '$(' in url or '`' in url or '||' in url or '&&' in url)
+            and _DANGEROUS_RE.search(url)):
+        return False, "URL contains potentially dangerous characters"
 
     # Parse URL
     try:
-        parsed = urlparse(url)
-    except Exception as e:
+        _, netloc, hostname, port, path = _split_pg_url(url)
+    except ValueError as e:
         return False, f"Failed to parse URL: {str(e)}"
 
-    # Validate scheme
-    if parsed.scheme not in ['postgresql', 'postgres']:
-        return False, f"Invalid scheme: {parsed.scheme} (must be 'postgresql' or 'postgres')"
-
     # Validate hostname is present
-    if not parsed.hostname:
+    if not hostname:
         return False, "URL must include a hostname"
 
     # Check for malformed URLs with multiple @ signs
-    if parsed.netloc.count('@') > 1:
+    if netloc.count('@') > 1:
         return False, "Invalid URL format: multiple @ signs"
 
-    # Validate hostname format (basic check)
-    hostname = parsed.hostname
-    if not re.match(r'^[a-zA-Z0-9]([a-zA-Z0-9\-\.]*[a-zA-Z0-9])?$', hostname):
+    # Validate hostname format (basic check); the length cap keeps regex work bounded
+    if len(hostname) > MAX_HOSTNAME_LENGTH or not _HOSTNAME_RE.match(hostname):
         return False, "Invalid hostname format"
 
-    # Validate port (if present)
-    try:
-        port = parsed.port
-        if port is not None:
-            if not (1 <= port <= 65535):
-                return False, f"Invalid port: {port} (must be 1-65535)"
-    except ValueError:
-        return False, "Invalid port format"
+    # Validate port range (if present)
+    if port is not None and not (1 <= port <= 65535):
+        return False, f"Invalid port: {port} (must be 1-65535)"
 
     # Validate path (database name)
-    if parsed.path:
-        db_name = parsed.path.lstrip('/')
+    if path:
+        db_name = path.lstrip('/')
         if db_name:
-            # Database names should be alphanumeric, underscore, hyphen
-            if not re.match(r'^[a-zA-Z0-9_\-]+$', db_name):
+            # Database names should be alphanumeric, underscore, hyphen (not leading)
+            if not _DBNAME_RE.match(db_name):
                 return False, "Invalid database name format"
 
     return True, None
 
 
 def get_api_key():
-    """Retrieve API key from SSM Parameter Store (cached)"""
+    """Retrieve API key from SSM Parameter Store (cached for API_KEY_TTL_SECONDS)"""
     global _api_key_cache
 
+    now = time.monotonic()
     if _api_key_cache is not None:
-        return _api_key_cache
+        cached_key, fetched_at = _api_key_cache
+        if now - fetched_at < API_KEY_TTL_SECONDS:
+            return cached_key
 
     if not API_KEY_PARAMETER_NAME:
         raise ValueError("API_KEY_PARAMETER_NAME environment variable not set")
 
     try:
-        response = ssm.get_parameter(
+        response = _client('ssm').get_parameter(
             Name=API_KEY_PARAMETER_NAME,
             WithDecryption=True
         )
-        _api_key_cache = response['Parameter']['Value']
-        return _api_key_cache
+        _api_key_cache = (response['Parameter']['Value'], now)
+        return _api_key_cache[0]
     except Exception as e:
         print(f"Failed to retrieve API key: {e}")
+        if _api_key_cache is not None:
+            # Keep serving the previous key rather than rejecting every request;
+            # retry the refresh after another TTL period
+            _api_key_cache = (_api_key_cache[0], now)
+            return _api_key_cache[0]
         raise
 
 
 def validate_api_key(event):
     """Validate API key from request headers"""
-    headers = event.get('headers', {})
+    headers = event.get('headers') or {}
 
-    # Headers are case-insensitive, normalize to lowercase
-    headers_lower = {k.lower(): v for k, v in headers.items()}
-
-    provided_key = headers_lower.get('x-api-key')
+    # HTTP APIs deliver lowercase header names, so try the exact key first;
+    # otherwise fall back to a case-insensitive scan that stops at the first match
+    provided_key = headers.get('x-api-key')
+    if provided_key is None:
+        provided_key = next((v for k, v in headers.items() if k.lower() == 'x-api-key'), None)
 
     if not provided_key:
         return False, "Missing x-api-key header"
 
     expected_key = get_api_key()
 
-    if provided_key != expected_key:
+    # Constant-time comparison so response timing does not leak key prefixes
+    if not hmac.compare_digest(provided_key.encode('utf-8'), expected_key.encode('utf-8')):
         return False, "Invalid API key"
 
     return True, None
@@ -237,7 +377,7 @@ def validate_api_key(event):
 
 def put_metric(metric_name, value=1.0, unit='Count', dimensions=None):
     """
-    Put custom CloudWatch metric for job tracking and monitoring
+    Emit custom CloudWatch metric for job tracking and monitoring
 
     Args:
         metric_name: Name of the metric (e.g., 'JobSubmitted', 'JobCompleted')
@@ -245,21 +385,26 @@ def put_metric(metric_name, value=1.0, unit='Count', dimensions=None):
         unit: Metric unit (default: 'Count')
         dimensions: Optional list of dimension dicts [{'Name': 'Status', 'Value': 'success'}]
     """
+    dimensions = dimensions or []
+
     try:
-        metric_data = {
-            'MetricName': metric_name,
-            'Value': value,
-            'Unit': unit,
-            'Timestamp': datetime.utcnow()
+        # CloudWatch Embedded Metric Format: Lambda ships this log line to
+        # CloudWatch Logs, which extracts the metric without an API call here
+        metric_log = {
+            '_aws': {
+                'Timestamp': int(time.time() * 1000),
+                'CloudWatchMetrics': [{
+                    'Namespace': 'SerenReplication',
+                    'Dimensions': [[d['Name'] for d in dimensions]],
+                    'Metrics': [{'Name': metric_name, 'Unit': unit}]
+                }]
+            },
+            metric_name: value
         }
+        for dimension in dimensions:
+            metric_log[dimension['Name']] = dimension['Value']
 
-        if dimensions:
-            metric_data['Dimensions'] = dimensions
-
-        cloudwatch.put_metric_data(
-            Namespace='SerenReplication',
-            MetricData=[metric_data]
-        )
+        print(_json_dumps(metric_log))
     except Exception as e:
         # Don't fail the request if metrics fail
         print(f"Failed to put metric {metric_name}: {e}")
@@ -280,7 +425,6 @@ def build_log_url(log_group, log_stream):
         return None
 
     # URL encode the log group and stream names
-    from urllib.parse import quote
     log_group_encoded = quote(log_group, safe='')
     log_stream_encoded = quote(log_stream, safe='')
 
@@ -295,7 +439,7 @@ def encrypt_data(plaintext):
         raise ValueError("KMS_KEY_ID environment variable not set")
 
     try:
-        response = kms.encrypt(
+        response = _client('kms').encrypt(
             KeyId=KMS_KEY_ID,
             Plaintext=plaintext.encode('utf-8')
         )
@@ -312,7 +456,7 @@ def decrypt_data(ciphertext_b64):
         # Base64 decode the ciphertext
         ciphertext = base64.b64decode(ciphertext_b64)
 
-        response = kms.decrypt(
+        response = _client('kms').decrypt(
             CiphertextBlob=ciphertext
         )
         return response['Plaintext'].decode('utf-8')
@@ -363,16 +507,10 @@ def choose_instance_type(estimated_size_bytes):
     Returns:
         EC2 instance type string (e.g., 't3.medium', 'c5.2xlarge')
     """
-    size_gb = estimated_size_bytes / (1024**3)
-
-    if size_gb < 10:
-        return 't3.medium'
-    elif size_gb < 100:
-        return 'c5.large'
-    elif size_gb < 1024:
-        return 'c5.2xlarge'
-    else:
-        return 'c5.4xlarge'
+    for size_limit_bytes, instance_type in _INSTANCE_TYPE_TIERS:
+        if estimated_size_bytes < size_limit_bytes:
+            return instance_type
+    return 'c5.4xlarge'
 
 
 def lambda_handler(event, context):
@@ -387,10 +525,7 @@ def lambda_handler(event, context):
     is_valid, error_msg = validate_api_key(event)
     if not is_valid:
         print(f"Authentication failed: {error_msg}")
-        return {
-            'statusCode': 401,
-            'body': json.dumps({'error': 'Unauthorized'})
-        }
+        return _RESP_UNAUTHORIZED
 
     try:
         if http_method == 'POST' and path == '/jobs':
@@ -399,86 +534,42 @@ def lambda_handler(event, context):
             job_id = path.split('/')[-1]
             return handle_get_job(job_id)
         else:
-            return {
-                'statusCode': 404,
-                'body': json.dumps({'error': 'Not found'})
-            }
+            return _RESP_NOT_FOUND
     except Exception as e:
         print(f"Error: {str(e)}")
-        return {
-            'statusCode': 500,
-            'body': json.dumps({'error': 'Internal server error'})
-        }
+        return _RESP_INTERNAL_ERROR
 
 
 def count_active_jobs():
-    """Count jobs in provisioning or running state"""
+    """Count jobs in provisioning or running state
+
+    Queries the status GSI once per active status so only active items are
+    read, instead of scanning the whole job history.
+    """
     try:
-        response = dynamodb.scan(
-            TableName=DYNAMODB_TABLE,
-            FilterExpression='#status IN (:provisioning, :running)',
-            ExpressionAttributeNames={'#status': 'status'},
-            ExpressionAttributeValues={
-                ':provisioning': {'S': 'provisioning'},
-                ':running': {'S': 'running'}
-            },
-            Select='COUNT'
-        )
-        return response['Count']
+        total = 0
+        for status_values in _ACTIVE_STATUS_VALUES:
+            query_args = {
+                'TableName': DYNAMODB_TABLE,
+                'IndexName': DYNAMODB_STATUS_INDEX,
+                'KeyConditionExpression': _STATUS_KEY_CONDITION,
+                'ExpressionAttributeNames': _STATUS_NAMES,
+                'ExpressionAttributeValues': status_values,
+                'Select': 'COUNT',
+            }
+            while True:
+                response = _client('dynamodb').query(**query_args)
+                total += response['Count']
+                if 'LastEvaluatedKey' not in response:
+                    break
+                query_args['ExclusiveStartKey'] = response['LastEvaluatedKey']
+        return total
     except Exception as e:
         print(f"Failed to count active jobs: {e}")
         # Return 0 on error to allow job submission (fail open)
         return 0
 
 
-def retry_with_backoff(func, max_retries=3, initial_delay=1):
-    """Retry a function with exponential backoff
-
-    Args:
-        func: Callable to retry
-        max_retries: Maximum number of retry attempts (default: 3)
-        initial_delay: Initial delay in seconds (default: 1)
-
-    Returns:
-        Result of func()
-
-    Raises:
-        Last exception if all retries fail
-    """
-    delay = initial_delay
-    last_exception = None
-
-    for attempt in range(max_retries):
-        try:
-            return func()
-        except ClientError as e:
-            last_exception = e
-            error_code = e.response.get('Error', {}).get('Code', '')
-
-            # Only retry on transient errors
-            retryable_errors = [
-                'RequestLimitExceeded',
-                'InsufficientInstanceCapacity',
-                'InternalError',
-                'ServiceUnavailable',
-                'Throttling'
-            ]
-
-            if error_code not in retryable_errors:
-                # Not a transient error, raise immediately
-                raise
-
-            if attempt < max_retries - 1:
-                print(f"Retry attempt {attempt + 1}/{max_retries} after {delay}s (error: {error_code})")
-                time.sleep(delay)
-                delay *= 2  # Exponential backoff
-            else:
-                print(f"All {max_retries} retries exhausted")
-
-    # All retries failed
-    raise last_exception
-
-
 def handle_submit_job(event):
     """Handle POST /jobs - submit new replication job"""
 
@@ -488,7 +579,7 @@ def handle_submit_job(event):
         print(f"Job submission rejected: {active_jobs} active jobs (limit: {MAX_CONCURRENT_JOBS})")
         return {
             'statusCode': 429,  # Too Many Requests
-            'body': json.dumps({
+            'body': _json_dumps({
                 'error': f'Maximum concurrent jobs limit reached ({MAX_CONCURRENT_JOBS}). Please try again later.'
             })
         }
@@ -499,16 +590,16 @@ def handle_submit_job(event):
     except Exception as e:
         return {
             'statusCode': 400,
-            'body': json.dumps({'error': f'Invalid JSON: {str(e)}'})
+            'body': _json_dumps({'error': f'Invalid JSON: {str(e)}'})
         }
 
     # Comprehensive validation of job spec
-    is_valid, error_msg = validate_job_spec(body)
+    is_valid, error_msg = validate_job_spec(body, raw_body=event['body'])
     if not is_valid:
         print(f"Job validation failed: {error_msg}")
         return {
             'statusCode': 400,
-            'body': json.dumps({'error': error_msg})
+            'body': _json_dumps({'error': error_msg})
         }
 
     # Generate job ID and trace ID for end-to-end tracing
@@ -519,24 +610,27 @@ def handle_submit_job(event):
 
     # Encrypt sensitive credentials
     try:
-        encrypted_source = encrypt_data(body['source_url'])
-        encrypted_target = encrypt_data(body['target_url'])
+        # Issue both KMS requests concurrently to overlap their round trips
+        source_future = _KMS_POOL.submit(encrypt_data, body['source_url'])
+        target_future = _KMS_POOL.submit(encrypt_data, body['target_url'])
+        encrypted_source = source_future.result()
+        encrypted_target = target_future.result()
     except Exception as e:
         print(f"Encryption failed: {e}")
         return {
             'statusCode': 500,
-            'body': json.dumps({'error': 'Failed to encrypt credentials'})
+            'body': _json_dumps({'error': 'Failed to encrypt credentials'})
         }
 
     # Log with redacted URLs
     print(f"[TRACE:{trace_id}] Job {job_id}: {body['command']} from {redact_url(body['source_url'])} to {redact_url(body['target_url'])}")
 
     # Create job record in DynamoDB with encrypted credentials
-    now = datetime.utcnow().isoformat() + 'Z'
+    now = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
     ttl = int(time.time()) + (30 * 86400)  # 30 days
 
     try:
-        dynamodb.put_item(
+        _client('dynamodb').put_item(
             TableName=DYNAMODB_TABLE,
             Item={
                 'job_id': {'S': job_id},
@@ -546,8 +640,8 @@ def handle_submit_job(event):
                 'command': {'S': body['command']},
                 'source_url_encrypted': {'S': encrypted_source},
                 'target_url_encrypted': {'S': encrypted_target},
-                'filter': {'S': json.dumps(body.get('filter', {}))},
-                'options': {'S': json.dumps(body.get('options', {}))},
+                'filter': {'S': _json_dumps(body.get('filter', {}))},
+                'options': {'S': _json_dumps(body.get('options', {}))},
                 'created_at': {'S': now},
                 'ttl': {'N': str(ttl)},
             }
@@ -556,48 +650,18 @@ def handle_submit_job(event):
         print(f"DynamoDB error: {e}")
         return {
             'statusCode': 500,
-            'body': json.dumps({'error': 'Failed to create job record'})
+            'body': _json_dumps({'error': 'Failed to create job record'})
         }
 
-    # Enqueue job for asynchronous provisioning
-    try:
-        message_body = {
-            'job_id': job_id,
-            'trace_id': trace_id,
-            'options': body.get('options', {})
-        }
+    # The DynamoDB stream relay enqueues the job for provisioning
+    print(f"[TRACE:{trace_id}] Job {job_id} recorded, awaiting provisioning")
 
-        sqs.send_message(
-            QueueUrl=PROVISIONING_QUEUE_URL,
-            MessageBody=json.dumps(message_body)
-        )
-
-        print(f"[TRACE:{trace_id}] Job {job_id} enqueued for provisioning")
-
-        # Emit metric for job submission
-        put_metric('JobSubmitted', dimensions=[{'Name': 'Command', 'Value': body['command']}])
-
-    except Exception as e:
-        print(f"Failed to enqueue job: {e}")
-        # Update job status to failed
-        dynamodb.update_item(
-            TableName=DYNAMODB_TABLE,
-            Key={'job_id': {'S': job_id}},
-            UpdateExpression='SET #status = :status, error = :error',
-            ExpressionAttributeNames={'#status': 'status'},
-            ExpressionAttributeValues={
-                ':status': {'S': 'failed'},
-                ':error': {'S': 'Failed to enqueue job'}
-            }
-        )
-        return {
-            'statusCode': 500,
-            'body': json.dumps({'error': 'Failed to enqueue job'})
-        }
+    # Emit metric for job submission
+    put_metric('JobSubmitted', dimensions=[{'Name': 'Command', 'Value': body['command']}])
 
     return {
         'statusCode': 201,
-        'body': json.dumps({
+        'body': _json_dumps({
             'job_id': job_id,
             'trace_id': trace_id,
             'status': 'provisioning'
@@ -636,27 +700,25 @@ set -euo pipefail
 /opt/seren-replicator/worker.sh "{job_id}"
 """
 
-    # Launch instance with retry logic for transient failures
-    def launch_instance():
-        return ec2.run_instances(
-            ImageId=WORKER_AMI_ID,
-            InstanceType=instance_type,
-            MinCount=1,
-            MaxCount=1,
-            IamInstanceProfile={'Name': WORKER_IAM_ROLE},
-            UserData=user_data,
-            TagSpecifications=[{
-                'ResourceType': 'instance',
-                'Tags': [
-                    {'Key': 'Name', 'Value': f'seren-replication-{job_id}'},
-                    {'Key': 'JobId', 'Value': job_id},
-                    {'Key': 'ManagedBy', 'Value': 'seren-replication-system'}
-                ]
-            }],
-            InstanceInitiatedShutdownBehavior='terminate',
-        )
+    # Launch instance; the EC2 client retries transient failures (adaptive mode)
+    response = _client('ec2').run_instances(
+        ImageId=WORKER_AMI_ID,
+        InstanceType=instance_type,
+        MinCount=1,
+        MaxCount=1,
+        IamInstanceProfile={'Name': WORKER_IAM_ROLE},
+        UserData=user_data,
+        TagSpecifications=[{
+            'ResourceType': 'instance',
+            'Tags': [
+                {'Key': 'Name', 'Value': f'seren-replication-{job_id}'},
+                {'Key': 'JobId', 'Value': job_id},
+                {'Key': 'ManagedBy', 'Value': 'seren-replication-system'}
+            ]
+        }],
+        InstanceInitiatedShutdownBehavior='terminate',
+    )
 
-    response = retry_with_backoff(launch_instance, max_retries=3, initial_delay=2)
     instance_id = response['Instances'][0]['InstanceId']
     return instance_id
 
@@ -665,7 +727,7 @@ def handle_get_job(job_id):
     """Handle GET /jobs/{job_id} - get job status"""
 
     try:
-        response = dynamodb.get_item(
+        response = _client('dynamodb').get_item(
             TableName=DYNAMODB_TABLE,
             Key={'job_id': {'S': job_id}}
         )
@@ -673,13 +735,13 @@ def handle_get_job(job_id):
         print(f"DynamoDB error: {e}")
         return {
             'statusCode': 500,
-            'body': json.dumps({'error': 'Database error'})
+            'body': _json_dumps({'error': 'Database error'})
         }
 
     if 'Item' not in response:
         return {
             'statusCode': 404,
-            'body': json.dumps({'error': 'Job not found'})
+            'body': _json_dumps({'error': 'Job not found'})
         }
 
     item = response['Item']
@@ -710,5 +772,14 @@ def handle_get_job(job_id):
 
     return {
         'statusCode': 200,
-        'body': json.dumps(job_status)
+        'body': _json_dumps(job_status)
     }
+
+
+# Fetch the API key during Lambda INIT so the first request skips the SSM round trip
+if API_KEY_PARAMETER_NAME:
+    try:
+        get_api_key()
+    except Exception:
+        # Already logged by get_api_key; the first request retries the fetch
+        pass
@@ -7,16 +7,18 @@ import json
 import time
 import boto3
 import os
-from botocore.exceptions import ClientError
+from datetime import datetime, timezone
+from botocore.config import Config
 
 # AWS clients
 dynamodb = boto3.client('dynamodb')
-ec2 = boto3.client('ec2')
+ec2 = boto3.client('ec2', config=Config(retries={'mode': 'adaptive', 'max_attempts': 4}))
 kms = boto3.client('kms')
 cloudwatch = boto3.client('cloudwatch')
 
 # Configuration from environment variables
 DYNAMODB_TABLE = os.environ.get('DYNAMODB_TABLE', 'replication-jobs')
+DYNAMODB_STATUS_INDEX = os.environ.get('DYNAMODB_STATUS_INDEX', 'status-created-index')
 WORKER_AMI_ID = os.environ.get('WORKER_AMI_ID', 'ami-xxxxxxxxx')
 WORKER_INSTANCE_TYPE = os.environ.get('WORKER_INSTANCE_TYPE', 'c5.2xlarge')
 WORKER_IAM_ROLE = os.environ.get('WORKER_IAM_ROLE', 'seren-replication-worker')
@@ -25,6 +27,27 @@ MAX_CONCURRENT_JOBS = int(os.environ.get('MAX_CONCURRENT_JOBS', '10'))
 AWS_REGION = os.environ.get('AWS_REGION', 'us-east-1')
 WORKER_LOG_GROUP = '/aws/ec2/seren-replication-worker'
 
+# Instance type tiers as (exclusive upper size bound in bytes, instance type)
+_INSTANCE_TYPE_TIERS = (
+    (10 * 1024**3, 't3.medium'),
+    (100 * 1024**3, 'c5.large'),
+    (1024 * 1024**3, 'c5.2xlarge'),
+)
+
+# DynamoDB expression constants shared across calls (treat as read-only)
+_STATUS_NAMES = {'#status': 'status'}
+_STATUS_KEY_CONDITION = '#status = :status'
+_FAIL_UPDATE_EXPR = 'SET #status = :status, error = :error'
+_INSTANCE_UPDATE_EXPR = 'SET instance_id = :iid, log_group = :lg, log_stream = :ls'
+_ACTIVE_STATUS_VALUES = (
+    {':status': {'S': 'provisioning'}},
+    {':status': {'S': 'running'}},
+)
+
+
+class JobDeferred(Exception):
+    """Raised to return a message to the queue without failing its job"""
+
 
 def choose_instance_type(estimated_size_bytes):
     """Choose EC2 instance type based on database size
@@ -41,16 +64,10 @@ def choose_instance_type(estimated_size_bytes):
     Returns:
         EC2 instance type string (e.g., 't3.medium', 'c5.2xlarge')
     """
-    size_gb = estimated_size_bytes / (1024**3)
-
-    if size_gb < 10:
-        return 't3.medium'
-    elif size_gb < 100:
-        return 'c5.large'
-    elif size_gb < 1024:
-        return 'c5.2xlarge'
-    else:
-        return 'c5.4xlarge'
+    for size_limit_bytes, instance_type in _INSTANCE_TYPE_TIERS:
+        if estimated_size_bytes < size_limit_bytes:
+            return instance_type
+    return 'c5.4xlarge'
 
 
 def put_metric(metric_name, value=1.0, unit='Count', dimensions=None):
@@ -64,12 +81,11 @@ def put_metric(metric_name, value=1.0, unit='Count', dimensions=None):
         dimensions: Optional list of dimension dicts [{'Name': 'InstanceType', 'Value': 't3.medium'}]
     """
     try:
-        from datetime import datetime
         metric_data = {
             'MetricName': metric_name,
             'Value': value,
             'Unit': unit,
-            'Timestamp': datetime.utcnow()
+            'Timestamp': datetime.now(timezone.utc)
         }
 
         if dimensions:
@@ -85,73 +101,35 @@ def put_metric(metric_name, value=1.0, unit='Count', dimensions=None):
 
 
 def count_active_jobs():
-    """Count jobs in provisioning or running state"""
+    """Count jobs in provisioning or running state
+
+    Queries the status GSI once per active status so only active items are
+    read, instead of scanning the whole job history.
+    """
     try:
-        response = dynamodb.scan(
-            TableName=DYNAMODB_TABLE,
-            FilterExpression='#status IN (:provisioning, :running)',
-            ExpressionAttributeNames={'#status': 'status'},
-            ExpressionAttributeValues={
-                ':provisioning': {'S': 'provisioning'},
-                ':running': {'S': 'running'}
-            },
-            Select='COUNT'
-        )
-        return response['Count']
+        total = 0
+        for status_values in _ACTIVE_STATUS_VALUES:
+            query_args = {
+                'TableName': DYNAMODB_TABLE,
+                'IndexName': DYNAMODB_STATUS_INDEX,
+                'KeyConditionExpression': _STATUS_KEY_CONDITION,
+                'ExpressionAttributeNames': _STATUS_NAMES,
+                'ExpressionAttributeValues': status_values,
+                'Select': 'COUNT',
+            }
+            while True:
+                response = dynamodb.query(**query_args)
+                total += response['Count']
+                if 'LastEvaluatedKey' not in response:
+                    break
+                query_args['ExclusiveStartKey'] = response['LastEvaluatedKey']
+        return total
     except Exception as e:
         print(f"Failed to count active jobs: {e}")
         # Return 0 on error to allow job submission (fail open)
         return 0
 
 
-def retry_with_backoff(func, max_retries=3, initial_delay=1):
-    """Retry a function with exponential backoff
-
-    Args:
-        func: Callable to retry
-        max_retries: Maximum number of retry attempts (default: 3)
-        initial_delay: Initial delay in seconds (default: 1)
-
-    Returns:
-        Result of func()
-
-    Raises:
-        Last exception if all retries fail
-    """
-    delay = initial_delay
-    last_exception = None
-
-    for attempt in range(max_retries):
-        try:
-            return func()
-        except ClientError as e:
-            last_exception = e
-            error_code = e.response.get('Error', {}).get('Code', '')
-
-            # Only retry on transient errors
-            retryable_errors = [
-                'RequestLimitExceeded',
-                'InsufficientInstanceCapacity',
-                'InternalError',
-                'ServiceUnavailable',
-                'Throttling'
-            ]
-
-            if error_code not in retryable_errors:
-                # Not a transient error, raise immediately
-                raise
-
-            if attempt < max_retries - 1:
-                print(f"Retry attempt {attempt + 1}/{max_retries} after {delay}s (error: {error_code})")
-                time.sleep(delay)
-                delay *= 2  # Exponential backoff
-            else:
-                print(f"All {max_retries} retries exhausted")
-
-    # All retries failed
-    raise last_exception
-
-
 def provision_worker(job_id, options=None):
     """Provision EC2 instance to run replication job
 
@@ -183,27 +161,25 @@ set -euo pipefail
 /opt/seren-replicator/worker.sh "{job_id}"
 """
 
-    # Launch instance with retry logic for transient failures
-    def launch_instance():
-        return ec2.run_instances(
-            ImageId=WORKER_AMI_ID,
-            InstanceType=instance_type,
-            MinCount=1,
-            MaxCount=1,
-            IamInstanceProfile={'Name': WORKER_IAM_ROLE},
-            UserData=user_data,
-            TagSpecifications=[{
-                'ResourceType': 'instance',
-                'Tags': [
-                    {'Key': 'Name', 'Value': f'seren-replication-{job_id}'},
-                    {'Key': 'JobId', 'Value': job_id},
-                    {'Key': 'ManagedBy', 'Value': 'seren-replication-system'}
-                ]
-            }],
-            InstanceInitiatedShutdownBehavior='terminate',
-        )
+    # Launch instance; the EC2 client retries transient failures (adaptive mode)
+    response = ec2.run_instances(
+        ImageId=WORKER_AMI_ID,
+        InstanceType=instance_type,
+        MinCount=1,
+        MaxCount=1,
+        IamInstanceProfile={'Name': WORKER_IAM_ROLE},
+        UserData=user_data,
+        TagSpecifications=[{
+            'ResourceType': 'instance',
+            'Tags': [
+                {'Key': 'Name', 'Value': f'seren-replication-{job_id}'},
+                {'Key': 'JobId', 'Value': job_id},
+                {'Key': 'ManagedBy', 'Value': 'seren-replication-system'}
+            ]
+        }],
+        InstanceInitiatedShutdownBehavior='terminate',
+    )
 
-    response = retry_with_backoff(launch_instance, max_retries=3, initial_delay=2)
     instance_id = response['Instances'][0]['InstanceId']
     return instance_id
 
@@ -225,12 +201,13 @@ def lambda_handler(event, context):
 
             print(f"[TRACE:{trace_id}] Processing job {job_id} from queue")
 
-            # Check concurrent job limit before provisioning
+            # Check concurrent job limit before provisioning; the count includes
+            # this job, which the coordinator already recorded as provisioning
             active_jobs = count_active_jobs()
-            if active_jobs >= MAX_CONCURRENT_JOBS:
+            if active_jobs > MAX_CONCURRENT_JOBS:
                 print(f"[TRACE:{trace_id}] Job {job_id} deferred: {active_jobs} active jobs (limit: {MAX_CONCURRENT_JOBS})")
-                # Raise exception to return message to queue for retry
-                raise Exception(f"Max concurrent jobs limit reached ({MAX_CONCURRENT_JOBS})")
+                # Raise to return message to queue for retry
+                raise JobDeferred(f"Max concurrent jobs limit reached ({MAX_CONCURRENT_JOBS})")
 
             # Provision EC2 instance
             instance_id = provision_worker(job_id, options)
@@ -243,7 +220,7 @@ def lambda_handler(event, context):
             dynamodb.update_item(
                 TableName=DYNAMODB_TABLE,
                 Key={'job_id': {'S': job_id}},
-                UpdateExpression='SET instance_id = :iid, log_group = :lg, log_stream = :ls',
+                UpdateExpression=_INSTANCE_UPDATE_EXPR,
                 ExpressionAttributeValues={
                     ':iid': {'S': instance_id},
                     ':lg': {'S': WORKER_LOG_GROUP},
@@ -259,6 +236,10 @@ def lambda_handler(event, context):
             ])
             put_metric('ProvisioningDuration', value=provisioning_duration, unit='Seconds')
 
+        except JobDeferred:
+            # Leave the job provisioning so the redelivered message can launch it
+            raise
+
         except Exception as e:
             print(f"[TRACE:{trace_id}] Failed to process job: {e}")
 
@@ -272,8 +253,8 @@ def lambda_handler(event, context):
                 dynamodb.update_item(
                     TableName=DYNAMODB_TABLE,
                     Key={'job_id': {'S': job_id}},
-                    UpdateExpression='SET #status = :status, error = :error',
-                    ExpressionAttributeNames={'#status': 'status'},
+                    UpdateExpression=_FAIL_UPDATE_EXPR,
+                    ExpressionAttributeNames=_STATUS_NAMES,
                     ExpressionAttributeValues={
                         ':status': {'S': 'failed'},
                         ':error': {'S': f'Provisioning failed: {str(e)}'}
@@ -0,0 +1,98 @@
+"""
+ABOUTME: Lambda function relaying new job records from DynamoDB Streams to SQS
+ABOUTME: Keeps queueing off the submit path so POST /jobs only writes the job record
+"""
+
+import json
+import boto3
+import os
+
+# AWS clients (created on first use so importing this module needs no AWS config)
+_clients = {}
+
+# Configuration from environment variables
+DYNAMODB_TABLE = os.environ.get('DYNAMODB_TABLE', 'replication-jobs')
+PROVISIONING_QUEUE_URL = os.environ.get('PROVISIONING_QUEUE_URL')
+
+# DynamoDB expression constants shared across calls (treat as read-only)
+_STATUS_NAMES = {'#status': 'status'}
+_FAIL_UPDATE_EXPR = 'SET #status = :status, error = :error'
+
+
+def _client(service_name):
+    """Return the cached boto3 client for a service, creating it on first use"""
+    client = _clients.get(service_name)
+    if client is None:
+        client = _clients[service_name] = boto3.client(service_name)
+    return client
+
+
+def relay_record(record):
+    """Enqueue one stream record's job, marking the job failed if it cannot be enqueued"""
+
+    # Only freshly inserted jobs awaiting provisioning are relayed
+    if record.get('eventName') != 'INSERT':
+        return
+
+    image = record['dynamodb'].get('NewImage', {})
+    if image.get('status', {}).get('S') != 'provisioning':
+        return
+
+    job_id = image['job_id']['S']
+    trace_id = image.get('trace_id', {}).get('S')
+
+    try:
+        options = json.loads(image.get('options', {}).get('S', '{}'))
+    except ValueError:
+        options = {}
+
+    message_body = {
+        'job_id': job_id,
+        'trace_id': trace_id,
+        'options': options
+    }
+
+    try:
+        # botocore retries transient errors before this raises
+        _client('sqs').send_message(
+            QueueUrl=PROVISIONING_QUEUE_URL,
+            MessageBody=json.dumps(message_body)
+        )
+    except Exception as e:
+        print(f"[TRACE:{trace_id}] Failed to enqueue job {job_id}: {e}")
+        # Fail the job so it does not hold a concurrency slot until its TTL;
+        # if this update raises too, the record is retried from the stream
+        _client('dynamodb').update_item(
+            TableName=DYNAMODB_TABLE,
+            Key={'job_id': {'S': job_id}},
+            UpdateExpression=_FAIL_UPDATE_EXPR,
+            ExpressionAttributeNames=_STATUS_NAMES,
+            ExpressionAttributeValues={
+                ':status': {'S': 'failed'},
+                ':error': {'S': 'Failed to enqueue job'}
+            }
+        )
+        return
+
+    print(f"[TRACE:{trace_id}] Job {job_id} enqueued for provisioning")
+
+
+def lambda_handler(event, context):
+    """Enqueue newly submitted jobs for provisioning"""
+
+    records = event['Records']
+    for index, record in enumerate(records):
+        try:
+            relay_record(record)
+        except Exception as e:
+            print(f"Failed to relay stream record: {e}")
+            # Report this record and everything after it so the stream retries
+            # from here without resending the jobs already enqueued
+            return {
+                'batchItemFailures': [
+                    {'itemIdentifier': r['dynamodb']['SequenceNumber']}
+                    for r in records[index:]
+                ]
+            }
+
+    return {'batchItemFailures': []}
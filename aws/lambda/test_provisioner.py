@@ -0,0 +1,83 @@
+"""
+ABOUTME: Tests for the SQS-triggered provisioner Lambda
+ABOUTME: Tests instance type selection and the concurrent job limit check
+"""
+
+import io
+import json
+import os
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+# Module-level boto3 clients need a region to be created
+with mock.patch.dict(os.environ, {'AWS_DEFAULT_REGION': 'us-east-1'}):
+    import provisioner
+
+
+class TestInstanceTypeSelection(unittest.TestCase):
+    """Test size-based instance type selection"""
+
+    def test_tier_boundaries(self):
+        """Each tier's upper bound should select the next tier"""
+        gb = 1024**3
+        cases = [
+            (1, 't3.medium'),
+            (10 * gb - 1, 't3.medium'),
+            (10 * gb, 'c5.large'),
+            (100 * gb, 'c5.2xlarge'),
+            (1024 * gb - 1, 'c5.2xlarge'),
+            (1024 * gb, 'c5.4xlarge'),
+            (5.5 * 1024 * gb, 'c5.4xlarge'),
+        ]
+
+        for size, expected in cases:
+            with self.subTest(size=size):
+                self.assertEqual(provisioner.choose_instance_type(size), expected, f"Wrong instance type for {size} bytes")
+
+
+class TestConcurrencyLimit(unittest.TestCase):
+    """Test the provisioner's concurrent job limit"""
+
+    def setUp(self):
+        self.dynamodb = mock.Mock()
+        self.ec2 = mock.Mock()
+        self.ec2.run_instances.return_value = {'Instances': [{'InstanceId': 'i-0123456789abcdef0'}]}
+        for patcher in [
+            mock.patch.object(provisioner, 'dynamodb', self.dynamodb),
+            mock.patch.object(provisioner, 'ec2', self.ec2),
+            mock.patch.object(provisioner, 'cloudwatch', mock.Mock()),
+            mock.patch.object(provisioner, 'MAX_CONCURRENT_JOBS', 10),
+        ]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _set_active_jobs(self, provisioning, running):
+        self.dynamodb.query.side_effect = [{'Count': provisioning}, {'Count': running}]
+
+    def _provision(self):
+        event = {'Records': [{'body': json.dumps({'job_id': 'job-1', 'trace_id': 'trace-1', 'options': {}})}]}
+        with redirect_stdout(io.StringIO()):
+            return provisioner.lambda_handler(event, None)
+
+    def test_at_limit_provisions(self):
+        """The job being provisioned counts toward the limit, so reaching it exactly is allowed"""
+        self._set_active_jobs(provisioning=4, running=6)
+
+        self._provision()
+
+        self.ec2.run_instances.assert_called_once()
+
+    def test_over_limit_defers_without_failing(self):
+        """Over the limit, the message is retried and the job is not marked failed"""
+        self._set_active_jobs(provisioning=5, running=6)
+
+        with self.assertRaises(provisioner.JobDeferred):
+            self._provision()
+
+        self.ec2.run_instances.assert_not_called()
+        self.dynamodb.update_item.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+ABOUTME: Tests for the DynamoDB Streams to SQS relay Lambda
+ABOUTME: Tests record filtering, message shape, and enqueue failure handling
+"""
+
+import io
+import json
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+import relay
+
+
+def _stream_record(sequence_number='1', event_name='INSERT', status='provisioning', options='{"drop_existing": true}'):
+    """Build a DynamoDB Streams record for a job"""
+    image = {
+        'job_id': {'S': f'job-{sequence_number}'},
+        'trace_id': {'S': f'trace-{sequence_number}'},
+        'status': {'S': status},
+    }
+    if options is not None:
+        image['options'] = {'S': options}
+    return {
+        'eventName': event_name,
+        'dynamodb': {'SequenceNumber': sequence_number, 'NewImage': image},
+    }
+
+
+class TestRelay(unittest.TestCase):
+    """Test relaying stream records to the provisioning queue"""
+
+    def setUp(self):
+        self.sqs = mock.Mock()
+        self.dynamodb = mock.Mock()
+        patcher = mock.patch.dict(relay._clients, {'sqs': self.sqs, 'dynamodb': self.dynamodb})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _relay(self, *records):
+        with redirect_stdout(io.StringIO()):
+            return relay.lambda_handler({'Records': list(records)}, None)
+
+    def _sent_bodies(self):
+        return [json.loads(c.kwargs['MessageBody']) for c in self.sqs.send_message.call_args_list]
+
+    def test_message_body(self):
+        """Relayed message should carry job_id, trace_id and options"""
+        result = self._relay(_stream_record())
+
+        self.assertEqual(result, {'batchItemFailures': []})
+        self.assertEqual(self._sent_bodies(), [
+            {'job_id': 'job-1', 'trace_id': 'trace-1', 'options': {'drop_existing': True}}
+        ])
+
+    def test_skips_non_insert_records(self):
+        """MODIFY and REMOVE records should not be relayed"""
+        for event_name in ['MODIFY', 'REMOVE']:
+            with self.subTest(event_name=event_name):
+                self._relay(_stream_record(event_name=event_name))
+                self.sqs.send_message.assert_not_called()
+
+    def test_skips_jobs_not_provisioning(self):
+        """Jobs in any other status should not be relayed"""
+        self._relay(_stream_record(status='running'))
+        self.sqs.send_message.assert_not_called()
+
+    def test_malformed_options(self):
+        """Unparseable or missing options should fall back to an empty dict"""
+        for options in ['{not json', None]:
+            with self.subTest(options=options):
+                self.sqs.reset_mock()
+                self._relay(_stream_record(options=options))
+                self.assertEqual(self._sent_bodies()[0]['options'], {})
+
+    def test_send_failure_marks_job_failed(self):
+        """A job that cannot be enqueued should be marked failed, not retried"""
+        self.sqs.send_message.side_effect = [Exception('queue unavailable'), None]
+
+        result = self._relay(_stream_record('1'), _stream_record('2'))
+
+        self.assertEqual(result, {'batchItemFailures': []})
+        self.dynamodb.update_item.assert_called_once()
+        update = self.dynamodb.update_item.call_args.kwargs
+        self.assertEqual(update['Key'], {'job_id': {'S': 'job-1'}})
+        self.assertEqual(update['ExpressionAttributeValues'][':status'], {'S': 'failed'})
+        self.assertEqual([body['job_id'] for body in self._sent_bodies()], ['job-1', 'job-2'])
+
+    def test_unhandled_failure_reports_remaining_records(self):
+        """If a job cannot be failed either, retry from that record without resending earlier ones"""
+        self.sqs.send_message.side_effect = [None, Exception('queue unavailable')]
+        self.dynamodb.update_item.side_effect = Exception('table unavailable')
+
+        result = self._relay(_stream_record('1'), _stream_record('2'), _stream_record('3'))
+
+        self.assertEqual(result, {'batchItemFailures': [{'itemIdentifier': '2'}, {'itemIdentifier': '3'}]})
+        self.assertEqual([body['job_id'] for body in self._sent_bodies()], ['job-1', 'job-2'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -64,6 +64,10 @@ resource "aws_dynamodb_table" "replication_jobs" {
     projection_type = "ALL"
   }
 
+  # Stream new job records to the relay Lambda for queueing
+  stream_enabled   = true
+  stream_view_type = "NEW_IMAGE"
+
   # TTL for automatic cleanup (30 days)
   ttl {
     attribute_name = "ttl"
@@ -100,6 +104,18 @@ resource "aws_sqs_queue" "provisioning_dlq" {
   }
 }
 
+# Dead Letter Queue for stream records the relay could not process
+resource "aws_sqs_queue" "relay_dlq" {
+  name                      = "${var.project_name}-relay-dlq"
+  message_retention_seconds = 1209600 # 14 days
+
+  tags = {
+    Name      = "${var.project_name}-relay-dlq"
+    ManagedBy = "terraform"
+    Project   = var.project_name
+  }
+}
+
 # SQS Queue for job provisioning
 resource "aws_sqs_queue" "provisioning_queue" {
   name                      = "${var.project_name}-provisioning-queue"
@@ -165,6 +181,16 @@ resource "aws_iam_role_policy" "lambda_policy" {
           "${aws_dynamodb_table.replication_jobs.arn}/index/*"
         ]
       },
+      {
+        Effect = "Allow"
+        Action = [
+          "dynamodb:DescribeStream",
+          "dynamodb:GetRecords",
+          "dynamodb:GetShardIterator",
+          "dynamodb:ListStreams"
+        ]
+        Resource = "${aws_dynamodb_table.replication_jobs.arn}/stream/*"
+      },
       {
         Effect = "Allow"
         Action = [
@@ -209,7 +235,8 @@ resource "aws_iam_role_policy" "lambda_policy" {
         ]
         Resource = [
           aws_sqs_queue.provisioning_queue.arn,
-          aws_sqs_queue.provisioning_dlq.arn
+          aws_sqs_queue.provisioning_dlq.arn,
+          aws_sqs_queue.relay_dlq.arn
         ]
       },
       {
@@ -310,13 +337,13 @@ resource "aws_lambda_function" "coordinator" {
   environment {
     variables = {
       DYNAMODB_TABLE         = aws_dynamodb_table.replication_jobs.name
+      DYNAMODB_STATUS_INDEX  = "status-created-index"
       WORKER_AMI_ID          = var.worker_ami_id
       WORKER_INSTANCE_TYPE   = var.worker_instance_type
       WORKER_IAM_ROLE        = aws_iam_instance_profile.worker_profile.name
       KMS_KEY_ID             = aws_kms_key.replication_data.key_id
       API_KEY_PARAMETER_NAME = aws_ssm_parameter.api_key.name
       MAX_CONCURRENT_JOBS    = var.max_concurrent_jobs
-      PROVISIONING_QUEUE_URL = aws_sqs_queue.provisioning_queue.url
     }
   }
 
@@ -351,12 +378,13 @@ resource "aws_lambda_function" "provisioner" {
 
   environment {
     variables = {
-      DYNAMODB_TABLE       = aws_dynamodb_table.replication_jobs.name
-      WORKER_AMI_ID        = var.worker_ami_id
-      WORKER_INSTANCE_TYPE = var.worker_instance_type
-      WORKER_IAM_ROLE      = aws_iam_instance_profile.worker_profile.name
-      KMS_KEY_ID           = aws_kms_key.replication_data.key_id
-      MAX_CONCURRENT_JOBS  = var.max_concurrent_jobs
+      DYNAMODB_TABLE        = aws_dynamodb_table.replication_jobs.name
+      DYNAMODB_STATUS_INDEX = "status-created-index"
+      WORKER_AMI_ID         = var.worker_ami_id
+      WORKER_INSTANCE_TYPE  = var.worker_instance_type
+      WORKER_IAM_ROLE       = aws_iam_instance_profile.worker_profile.name
+      KMS_KEY_ID            = aws_kms_key.replication_data.key_id
+      MAX_CONCURRENT_JOBS   = var.max_concurrent_jobs
     }
   }
 
@@ -399,6 +427,79 @@ resource "aws_lambda_event_source_mapping" "sqs_trigger" {
   enabled          = true
 }
 
+# Lambda function relaying new job records from DynamoDB Streams to SQS
+resource "aws_lambda_function" "relay" {
+  filename      = "${path.module}/../lambda/lambda.zip"
+  function_name = "${var.project_name}-relay"
+  role          = aws_iam_role.lambda_execution.arn
+  handler       = "relay.lambda_handler"
+  runtime       = "python3.11"
+  timeout       = 30
+  memory_size   = 128
+
+  environment {
+    variables = {
+      DYNAMODB_TABLE         = aws_dynamodb_table.replication_jobs.name
+      PROVISIONING_QUEUE_URL = aws_sqs_queue.provisioning_queue.url
+    }
+  }
+
+  tags = {
+    Name      = "${var.project_name}-relay"
+    ManagedBy = "terraform"
+    Project   = var.project_name
+  }
+}
+
+# CloudWatch Log Group for relay Lambda
+resource "aws_cloudwatch_log_group" "relay_logs" {
+  name              = "/aws/lambda/${aws_lambda_function.relay.function_name}"
+  retention_in_days = 7
+
+  tags = {
+    Name      = "${var.project_name}-relay-logs"
+    ManagedBy = "terraform"
+    Project   = var.project_name
+  }
+}
+
+# DynamoDB Streams Event Source Mapping for relay Lambda
+resource "aws_lambda_event_source_mapping" "jobs_stream_trigger" {
+  event_source_arn               = aws_dynamodb_table.replication_jobs.stream_arn
+  function_name                  = aws_lambda_function.relay.arn
+  starting_position              = "LATEST"
+  batch_size                     = 10
+  maximum_retry_attempts         = 5
+  bisect_batch_on_function_error = true
+  enabled                        = true
+
+  # The relay reports the first record it could not process, so retries
+  # resume there instead of resending jobs that were already enqueued
+  function_response_types = ["ReportBatchItemFailures"]
+
+  # Only new jobs awaiting provisioning invoke the relay
+  filter_criteria {
+    filter {
+      pattern = jsonencode({
+        eventName = ["INSERT"]
+        dynamodb = {
+          NewImage = {
+            status = { S = ["provisioning"] }
+          }
+        }
+      })
+    }
+  }
+
+  # The relay marks jobs failed when they cannot be enqueued; only records it
+  # could not mark (e.g. DynamoDB unavailable) exhaust retries and land here
+  destination_config {
+    on_failure {
+      destination_arn = aws_sqs_queue.relay_dlq.arn
+    }
+  }
+}
+
 # API Gateway (HTTP API)
 resource "aws_apigatewayv2_api" "api" {
   name          = "${var.project_name}-api"